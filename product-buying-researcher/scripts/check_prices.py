@@ -18,6 +18,7 @@ Options:
     --url URL          Scrape a specific product URL for its price
     --max-results N    Max retailers to check (default: 10)
     --country CODE     Country code (default: us)
+    --merge            Combine results from all available sources
     --output FILE      Write JSON to file
     --pretty           Pretty-print JSON
 
@@ -26,15 +27,179 @@ Environment Variables:
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import re
 import sys
 from urllib.parse import urlparse
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(data, pretty=False):
+    """Encode data to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        ensure_ascii=False,
+        separators=(",", ": ") if pretty else (",", ":"),
+    ).encode("utf-8")
+
+
+def _write_json_stream(f, envelope, key, items, pretty=False):
+    """Write output incrementally: envelope fields, then one item at a time.
+
+    Keeps peak memory at one encoded item instead of the whole serialized
+    result. Pretty output keeps the one-shot encoder; it is for human
+    eyes, not large batches.
+    """
+    if pretty:
+        full = dict(envelope)
+        full[key] = items
+        f.write(_dump_json_bytes(full, pretty=True))
+        return
+    f.write(_dump_json_bytes(envelope)[:-1])
+    f.write(b',"' + key.encode("utf-8") + b'":[')
+    for i, item in enumerate(items):
+        if i:
+            f.write(b",")
+        f.write(_dump_json_bytes(item))
+    f.write(b"]}")
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Compiled once; these run per shopping result / per page in the hot paths.
+_PRICE_NUM_RE = re.compile(r"[\d,]+\.?\d*")
+
+# Currency symbols and separators dropped before float() parsing.
+_PRICE_STRIP = str.maketrans("", "", "$\u00a3\u20ac, \t\u00a0")
+
+# Symbol-prefixed prices resolve their currency with one dict lookup.
+_CURRENCY_BY_SYMBOL = {"$": "USD", "\u00a3": "GBP", "\u20ac": "EUR"}
+# All page clues (symbol price, code-suffixed price, <title>) as one
+# alternation, so a page is scanned in a single pass instead of three.
+_SCAN_RE = re.compile(
+    r"(?P<sym>[\$\£\€][\d,]+\.?\d*)"
+    r"|(?P<code>[\d,]+\.?\d*\s*(?:USD|EUR|GBP))"
+    r"|<title[^>]*>(?P<title>.*?)</title>",
+    re.IGNORECASE | re.DOTALL,
+)
+_WS_RE = re.compile(r"\s+")
+
+# Bytes-level price clue ($/£/€ as UTF-8) for early-stopping the download.
+_PRICE_SYM_BYTES_RE = re.compile(rb"(?:\$|\xc2\xa3|\xe2\x82\xac)[\d,]+\.?\d*")
+
+# Product pages run 1-5 MB but the price is almost always in the first
+# few hundred KB; cap the download instead of reading the whole body.
+_MAX_FETCH_BYTES = 512 * 1024
+_FETCH_CHUNK_BYTES = 64 * 1024
+
+# Shared session so repeated scrapes reuse pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake per URL.
+_SESSION = None
+
+# Direct SerpAPI endpoint; a pooled httpx client is built lazily for it.
+_SERPAPI_URL = "https://serpapi.com/search.json"
+_SERP_CLIENT = None
+
+# Known price locations for major retailers, keyed by registrable domain.
+# One targeted XPath query beats regex-scanning the whole HTML blob and
+# returns the actual product price, not the first "$" on the page.
+# Used only when lxml is installed; unknown domains fall back to regex.
+_DOMAIN_XPATHS = {
+    "amazon.com": '//span[@class="a-offscreen"]/text()',
+    "ebay.com": '//span[@itemprop="price"]/@content',
+    "bestbuy.com": '//div[contains(@class, "priceView-hero-price")]/span/text()',
+    "walmart.com": '//span[@itemprop="price"]/text()',
+    "target.com": '//span[@data-test="product-price"]/text()',
+}
+
+
+def _domain_xpath(domain):
+    """Look up the price XPath for a netloc, matching on domain suffix."""
+    domain = domain.lower()
+    if domain.startswith("www."):
+        domain = domain[4:]
+    for known, xpath in _DOMAIN_XPATHS.items():
+        if domain == known or domain.endswith("." + known):
+            return xpath
+    return None
+
+
+def _coerce_price(value):
+    """Coerce a price that may be a number or a string like "$29.99" to float."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    # Strip currency symbols/separators in one C-level pass and try
+    # float() directly; the regex only runs for oddly formatted strings.
+    stripped = value.translate(_PRICE_STRIP)
+    try:
+        return float(stripped)
+    except ValueError:
+        match = _PRICE_NUM_RE.search(stripped)
+        return float(match.group()) if match else None
+
+
+def _get_session():
+    """Return a module-level requests.Session with connection pooling."""
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from urllib3.util.retry import Retry
+
+        _SESSION = requests.Session()
+        _SESSION.headers.update(DEFAULT_HEADERS)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+def _serpapi_get(params):
+    """Fetch a SerpAPI result dict.
+
+    SerpAPI is a single JSON GET, so prefer a direct call over a pooled
+    client (httpx with HTTP/2 if installed, else the shared requests
+    session) and keep the blocking GoogleSearch SDK only as a fallback.
+    Returns None when no transport is available.
+    """
+    global _SERP_CLIENT
+    try:
+        import httpx
+
+        if _SERP_CLIENT is None:
+            try:
+                _SERP_CLIENT = httpx.Client(http2=True, timeout=30.0)
+            except ImportError:  # h2 extra not installed
+                _SERP_CLIENT = httpx.Client(timeout=30.0)
+        return _SERP_CLIENT.get(_SERPAPI_URL, params=params).json()
+    except ImportError:
+        pass
+
+    try:
+        return _get_session().get(_SERPAPI_URL, params=params, timeout=30).json()
+    except ImportError:
+        pass
 
-def check_via_serpapi(query, max_results=10, country="us"):
-    """Search Google Shopping for multi-retailer price comparison."""
     try:
         from serpapi import GoogleSearch
     except ImportError:
@@ -42,7 +207,11 @@ def check_via_serpapi(query, max_results=10, country="us"):
             from serpapi.google_search import GoogleSearch
         except ImportError:
             return None
+    return GoogleSearch(params).get_dict()
+
 
+def check_via_serpapi(query, max_results=10, country="us"):
+    """Search Google Shopping for multi-retailer price comparison."""
     api_key = os.environ.get("SERPAPI_API_KEY")
     if not api_key:
         return None
@@ -56,22 +225,21 @@ def check_via_serpapi(query, max_results=10, country="us"):
     }
 
     try:
-        search = GoogleSearch(params)
-        results = search.get_dict()
+        results = _serpapi_get(params)
     except Exception as e:
         print(f"SerpAPI error: {e}", file=sys.stderr)
         return None
 
+    if results is None:
+        return None
+
     if "error" in results:
         print(f"SerpAPI error: {results['error']}", file=sys.stderr)
         return None
 
     prices = []
     for item in results.get("shopping_results", [])[:max_results]:
-        price = item.get("extracted_price")
-        if isinstance(price, str):
-            match = re.search(r"[\d,]+\.?\d*", price.replace(",", ""))
-            price = float(match.group()) if match else None
+        price = _coerce_price(item.get("extracted_price"))
 
         prices.append(
             {
@@ -106,10 +274,7 @@ def check_via_amazon(query, max_results=10, country="us"):
 
     prices = []
     for item in results[:max_results]:
-        price = item.get("price")
-        if isinstance(price, str):
-            match = re.search(r"[\d,]+\.?\d*", price.replace(",", ""))
-            price = float(match.group()) if match else None
+        price = _coerce_price(item.get("price"))
 
         prices.append(
             {
@@ -143,50 +308,88 @@ def scrape_url_price(url):
         )
         Price = None
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "Accept-Language": "en-US,en;q=0.9",
-    }
-
     try:
-        resp = requests.get(url, headers=headers, timeout=15)
+        resp = _get_session().get(url, timeout=15, stream=True)
         resp.raise_for_status()
+        # Stream in chunks and stop early once the head has been read and
+        # a price clue has appeared, or when the size cap is hit.
+        content = bytearray()
+        for chunk in resp.iter_content(_FETCH_CHUNK_BYTES):
+            content.extend(chunk)
+            if len(content) >= _MAX_FETCH_BYTES:
+                break
+            if b"</head>" in content and _PRICE_SYM_BYTES_RE.search(content):
+                break
+        resp.close()
     except Exception as e:
         print(f"Failed to fetch {url}: {e}", file=sys.stderr)
         return None
 
-    html = resp.text
+    content = bytes(content)
+    html = content.decode(resp.encoding or "utf-8", "ignore")
     domain = urlparse(url).netloc
 
     price_value = None
     currency = "USD"
 
-    if Price:
-        # price-parser: find price patterns in raw HTML
-        price_patterns = re.findall(r"[\$\£\€][\d,]+\.?\d*", html)
-        price_patterns += re.findall(r"[\d,]+\.?\d*\s*(?:USD|EUR|GBP)", html)
-        if price_patterns:
-            parsed = Price.fromstring(price_patterns[0])
-            if parsed.amount is not None:
-                price_value = float(parsed.amount)
-                currency = parsed.currency or "USD"
-    else:
-        # Regex fallback: dollar prices
-        matches = re.findall(r"\$[\d,]+\.?\d*", html)
-        if matches:
-            match = re.search(r"[\d,]+\.?\d*", matches[0].replace(",", ""))
-            if match:
-                price_value = float(match.group())
-
-    # Try to extract title from <title> tag
-    title_match = re.search(
-        r"<title[^>]*>(.*?)</title>", html, re.IGNORECASE | re.DOTALL
-    )
-    title = title_match.group(1).strip() if title_match else ""
-    title = re.sub(r"\s+", " ", title)[:200]
+    # For known retailers, one targeted XPath query beats regex-scanning
+    # the whole page and finds the real product price. Needs lxml.
+    xpath = _domain_xpath(domain)
+    if xpath:
+        try:
+            from lxml import html as lxml_html
+        except ImportError:
+            lxml_html = None
+
+        if lxml_html is not None:
+            try:
+                tree = lxml_html.fromstring(content)
+                matches = tree.xpath(xpath)
+            except Exception:
+                matches = []
+            for text in matches:
+                text = str(text)
+                if Price:
+                    parsed = Price.fromstring(text)
+                    if parsed.amount is not None:
+                        price_value = float(parsed.amount)
+                        currency = parsed.currency or "USD"
+                else:
+                    price_value = _coerce_price(text)
+                if price_value is not None:
+                    break
+
+    # One scan over the page collects all remaining clues — the first
+    # symbol price, the first code-suffixed price, and the <title> tag —
+    # and stops as soon as everything needed has been seen.
+    sym_token = code_token = None
+    title = ""
+    for match in _SCAN_RE.finditer(html):
+        kind = match.lastgroup
+        if kind == "sym" and sym_token is None:
+            sym_token = match.group("sym")
+        elif kind == "code" and code_token is None:
+            code_token = match.group("code")
+        elif kind == "title" and not title:
+            title = match.group("title")
+        if title and (sym_token or price_value is not None):
+            break
+    title = _WS_RE.sub(" ", title.strip())[:200]
+
+    if price_value is None and sym_token:
+        # Fast path: currency is an O(1) symbol lookup and the amount
+        # goes through _coerce_price; price-parser is not needed here.
+        price_value = _coerce_price(sym_token)
+        if price_value is not None:
+            currency = _CURRENCY_BY_SYMBOL.get(sym_token[0], "USD")
+
+    if price_value is None and code_token and Price:
+        # Slow path: amount followed by a currency code ("29.99 EUR");
+        # let price-parser sort out amount and currency.
+        parsed = Price.fromstring(code_token)
+        if parsed.amount is not None:
+            price_value = float(parsed.amount)
+            currency = parsed.currency or "USD"
 
     return {
         "store": domain,
@@ -209,6 +412,11 @@ def main():
         "--max-results", type=int, default=10, help="Max retailers (default: 10)"
     )
     parser.add_argument("--country", default="us", help="Country code (default: us)")
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Combine results from all available sources (dedup by store+url)",
+    )
     parser.add_argument("--output", help="Write JSON to file")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
 
@@ -227,15 +435,46 @@ def main():
         prices = None
         source_used = None
 
-        if os.environ.get("SERPAPI_API_KEY"):
-            prices = check_via_serpapi(query, args.max_results, args.country)
-            if prices is not None:
-                source_used = "google_shopping"
+        # Query both sources at once: Amazon runs speculatively while
+        # SerpAPI is in flight, so the fallback (or --merge) costs
+        # max(t_serp, t_amazon) instead of their sum.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            f_serp = (
+                executor.submit(check_via_serpapi, query, args.max_results, args.country)
+                if os.environ.get("SERPAPI_API_KEY")
+                else None
+            )
+            f_amazon = executor.submit(
+                check_via_amazon, query, args.max_results, args.country
+            )
 
-        if prices is None:
-            prices = check_via_amazon(query, args.max_results, args.country)
-            if prices is not None:
-                source_used = "amazon"
+            serp = f_serp.result() if f_serp else None
+
+            if args.merge:
+                amazon = f_amazon.result()
+                if serp is not None or amazon is not None:
+                    seen = set()
+                    prices = []
+                    for p in (serp or []) + (amazon or []):
+                        key = (p.get("store", ""), p.get("url", ""))
+                        if key not in seen:
+                            seen.add(key)
+                            prices.append(p)
+                    source_used = "+".join(
+                        name
+                        for name, result in (
+                            ("google_shopping", serp),
+                            ("amazon", amazon),
+                        )
+                        if result is not None
+                    )
+            elif serp is not None:
+                prices, source_used = serp, "google_shopping"
+                f_amazon.cancel()
+            else:
+                amazon = f_amazon.result()
+                if amazon is not None:
+                    prices, source_used = amazon, "amazon"
 
         if prices is None:
             print(
@@ -250,24 +489,24 @@ def main():
     valid_prices = [p for p in prices if p.get("price") is not None]
     valid_prices.sort(key=lambda p: p["price"])
 
-    output = {
+    envelope = {
         "query": query,
         "source": source_used,
         "count": len(prices),
         "lowest_price": valid_prices[0]["price"] if valid_prices else None,
         "highest_price": valid_prices[-1]["price"] if valid_prices else None,
-        "prices": prices,
     }
 
-    indent = 2 if args.pretty else None
-    json_str = json.dumps(output, indent=indent, ensure_ascii=False)
-
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(json_str)
+        with open(args.output, "wb") as f:
+            _write_json_stream(f, envelope, "prices", prices, pretty=args.pretty)
         print(f"Results written to {args.output}", file=sys.stderr)
     else:
-        print(json_str)
+        _write_json_stream(
+            sys.stdout.buffer, envelope, "prices", prices, pretty=args.pretty
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
@@ -18,36 +18,144 @@ Options:
     --dry-run          Show what would change without modifying the file
     --output FILE      Write enriched data to a different file
     --pretty           Pretty-print JSON output
+    --workers N        Parallel enrichment workers (default: 8, 1 = serial)
+    --max-age-days N   Re-check complete products only if their prices were
+                       last verified more than N days ago
 
 Environment Variables:
     SERPAPI_API_KEY     API key for SerpAPI (https://serpapi.com)
 """
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import os
 import re
 import sys
+import time
+from datetime import datetime, timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once; runs per shopping result in the enrichment loop.
+_PRICE_NUM_RE = re.compile(r"[\d,]+\.?\d*")
+
+# Currency symbols and separators dropped before float() parsing.
+_PRICE_STRIP = str.maketrans("", "", "$\u00a3\u20ac, \t\u00a0")
+_WS_RE = re.compile(r"\s+")
+
+# Direct SerpAPI endpoint; a pooled httpx client is built lazily for it.
+_SERPAPI_URL = "https://serpapi.com/search.json"
+_SERP_CLIENT = None
+
+
+def _load_json_bytes(raw):
+    """Decode JSON bytes, via orjson when available (2-10x faster)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dump_json_bytes(data, pretty=False):
+    """Encode data to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        ensure_ascii=False,
+        separators=(",", ": ") if pretty else (",", ":"),
+    ).encode("utf-8")
+
+
+def _coerce_price(value):
+    """Coerce a price that may be a number or a string like "$29.99" to float."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    # Strip currency symbols/separators in one C-level pass and try
+    # float() directly; the regex only runs for oddly formatted strings.
+    stripped = value.translate(_PRICE_STRIP)
+    try:
+        return float(stripped)
+    except ValueError:
+        match = _PRICE_NUM_RE.search(stripped)
+        return float(match.group()) if match else None
 
 
 def search_product_data(product_name, source="auto"):
-    """Search for a product and return price/image data from available sources."""
+    """Search for a product and return price/image data from available sources.
+
+    Lookups are memoized per run on a normalized name, so duplicate
+    product names (same product in multiple categories) cost one API call.
+    """
+    name_key = _WS_RE.sub(" ", product_name.lower()).strip()
+    cached = _cached_search(name_key or product_name, source)
+    # Return a copy so callers never mutate the cached entry.
+    return {
+        "prices": {store: dict(info) for store, info in cached["prices"].items()},
+        "image": cached["image"],
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_search(name_key, source):
     results = {"prices": {}, "image": None}
 
+    if source in ("auto", "serpapi"):
+        prefetched = _BATCH_RESULTS.get(name_key)
+        if prefetched:
+            return prefetched
+
     if source in ("auto", "serpapi") and os.environ.get("SERPAPI_API_KEY"):
-        serpapi_data = _search_serpapi(product_name)
+        serpapi_data = _search_serpapi(name_key)
         if serpapi_data:
             return serpapi_data
 
     if source in ("auto", "amazon"):
-        amazon_data = _search_amazon(product_name)
+        amazon_data = _search_amazon(name_key)
         if amazon_data:
             return amazon_data
 
     return results
 
 
-def _search_serpapi(product_name):
+def _serpapi_get(params, url=_SERPAPI_URL):
+    """Fetch a SerpAPI result dict.
+
+    SerpAPI is a single JSON GET, so prefer a direct call over a pooled
+    client (httpx with HTTP/2 if installed, else requests) and keep the
+    blocking GoogleSearch SDK only as a fallback. Returns None when no
+    transport is available.
+    """
+    global _SERP_CLIENT
+    try:
+        import httpx
+
+        if _SERP_CLIENT is None:
+            try:
+                _SERP_CLIENT = httpx.Client(http2=True, timeout=30.0)
+            except ImportError:  # h2 extra not installed
+                _SERP_CLIENT = httpx.Client(timeout=30.0)
+        return _SERP_CLIENT.get(url, params=params).json()
+    except ImportError:
+        pass
+
+    try:
+        import requests
+
+        return requests.get(url, params=params, timeout=30).json()
+    except ImportError:
+        pass
+
+    if url != _SERPAPI_URL:
+        # The SDK only speaks the plain search endpoint.
+        return None
     try:
         from serpapi import GoogleSearch
     except ImportError:
@@ -55,13 +163,82 @@ def _search_serpapi(product_name):
             from serpapi.google_search import GoogleSearch
         except ImportError:
             return None
+    return GoogleSearch(params).get_dict()
+
+
+# Results seeded by the batch prefetch, keyed by normalized name.
+_BATCH_RESULTS = {}
+
 
+def prefetch_serpapi_batch(names, poll_interval=1.0, poll_timeout=60.0):
+    """Queue one async SerpAPI search per name and collect them in bulk.
+
+    SerpAPI's async=true mode queues searches server-side, so N queries
+    cost N cheap submissions plus a poll loop instead of N full
+    round-trips. Results land in _BATCH_RESULTS for _cached_search to
+    pick up; on any submission problem we simply leave the per-call
+    path to do its normal work.
+    """
+    api_key = os.environ.get("SERPAPI_API_KEY")
+    if not api_key or len(names) < 2:
+        return
+
+    pending = {}
+    for name in names:
+        name_key = _WS_RE.sub(" ", name.lower()).strip()
+        if not name_key or name_key in pending or name_key in _BATCH_RESULTS:
+            continue
+        try:
+            submitted = _serpapi_get(
+                {
+                    "engine": "google_shopping",
+                    "q": name_key,
+                    "api_key": api_key,
+                    "num": 5,
+                    "async": "true",
+                }
+            )
+            search_id = submitted["search_metadata"]["id"]
+        except Exception as e:
+            print(
+                f"  SerpAPI batch submit failed ({e}); using per-call searches",
+                file=sys.stderr,
+            )
+            return
+        pending[name_key] = search_id
+
+    deadline = time.monotonic() + poll_timeout
+    while pending and time.monotonic() < deadline:
+        still_pending = {}
+        for name_key, search_id in pending.items():
+            try:
+                data = _serpapi_get(
+                    {"api_key": api_key},
+                    url=f"https://serpapi.com/searches/{search_id}.json",
+                )
+            except Exception:
+                continue
+            if data is None:
+                return
+            status = data.get("search_metadata", {}).get("status", "")
+            if status == "Processing":
+                still_pending[name_key] = search_id
+            else:
+                parsed = _parse_serpapi_shopping(data)
+                if parsed:
+                    _BATCH_RESULTS[name_key] = parsed
+        pending = still_pending
+        if pending:
+            time.sleep(poll_interval)
+
+
+def _search_serpapi(product_name):
     api_key = os.environ.get("SERPAPI_API_KEY")
     if not api_key:
         return None
 
     try:
-        search = GoogleSearch(
+        data = _serpapi_get(
             {
                 "engine": "google_shopping",
                 "q": product_name,
@@ -69,11 +246,18 @@ def _search_serpapi(product_name):
                 "num": 5,
             }
         )
-        data = search.get_dict()
     except Exception as e:
         print(f"  SerpAPI error for '{product_name}': {e}", file=sys.stderr)
         return None
 
+    if data is None:
+        return None
+
+    return _parse_serpapi_shopping(data)
+
+
+def _parse_serpapi_shopping(data):
+    """Extract prices/image from a SerpAPI google_shopping result dict."""
     shopping = data.get("shopping_results", [])
     if not shopping:
         return None
@@ -83,10 +267,7 @@ def _search_serpapi(product_name):
 
     for item in shopping[:5]:
         store = item.get("source", "Unknown")
-        price = item.get("extracted_price")
-        if isinstance(price, str):
-            match = re.search(r"[\d,]+\.?\d*", price.replace(",", ""))
-            price = float(match.group()) if match else None
+        price = _coerce_price(item.get("extracted_price"))
         link = item.get("link", "")
 
         if price is not None:
@@ -118,10 +299,7 @@ def _search_amazon(product_name):
     image = None
 
     for item in results[:3]:
-        price = item.get("price")
-        if isinstance(price, str):
-            match = re.search(r"[\d,]+\.?\d*", price.replace(",", ""))
-            price = float(match.group()) if match else None
+        price = _coerce_price(item.get("price"))
 
         if price is not None:
             prices["Amazon"] = {"price": price, "url": item.get("url", "")}
@@ -133,11 +311,41 @@ def _search_amazon(product_name):
     return {"prices": prices, "image": image}
 
 
-def enrich_product(product, dry_run=False):
+def _recently_checked(buy_links, max_age_days):
+    """True when every link carries a checked_at stamp newer than the cutoff."""
+    if max_age_days is None:
+        return True
+    cutoff = time.time() - max_age_days * 86400
+    for link in buy_links:
+        stamp = link.get("checked_at")
+        if not stamp:
+            return False
+        try:
+            checked = datetime.fromisoformat(stamp).timestamp()
+        except ValueError:
+            return False
+        if checked < cutoff:
+            return False
+    return True
+
+
+def enrich_product(product, dry_run=False, max_age_days=None):
     """Enrich a single product with live data. Returns (product, changes_list)."""
     name = product.get("name", "Unknown")
     changes = []
 
+    # The fastest API call is the one never made: a product with an
+    # image and a well-populated, priced (and, with --max-age-days,
+    # recently verified) set of buy links needs no network hop.
+    links = product.get("buyLinks", [])
+    if (
+        product.get("image")
+        and len(links) >= 3
+        and all(link.get("price") for link in links)
+        and _recently_checked(links, max_age_days)
+    ):
+        return product, changes
+
     live_data = search_product_data(name)
     if not live_data or (not live_data["prices"] and not live_data["image"]):
         return product, changes
@@ -149,29 +357,36 @@ def enrich_product(product, dry_run=False):
 
     if live_data["prices"]:
         buy_links = product.get("buyLinks", [])
-        existing_stores = {link.get("store", "").lower() for link in buy_links}
+        # Index existing links by lowercased store once, instead of
+        # rescanning buy_links for every live price.
+        by_store = {link.get("store", "").lower(): link for link in buy_links}
 
+        checked_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         for store, price_info in live_data["prices"].items():
-            if store.lower() in existing_stores:
-                for link in buy_links:
-                    if link.get("store", "").lower() == store.lower():
-                        old_price = link.get("price")
-                        new_price = price_info["price"]
-                        if old_price != new_price:
-                            if not dry_run:
-                                link["price"] = f"${new_price:.2f}"
-                            changes.append(
-                                f"Updated {store} price: ${old_price} -> ${new_price:.2f}"
-                            )
-                        break
+            store_key = store.lower()
+            link = by_store.get(store_key)
+            if link is not None:
+                old_price = link.get("price")
+                new_price = price_info["price"]
+                if old_price != new_price:
+                    if not dry_run:
+                        link["price"] = f"${new_price:.2f}"
+                    changes.append(
+                        f"Updated {store} price: ${old_price} -> ${new_price:.2f}"
+                    )
+                if not dry_run:
+                    # Stamp even unchanged links: the price was verified.
+                    link["checked_at"] = checked_at
             else:
                 new_link = {
                     "store": store,
                     "url": price_info["url"],
                     "price": f"${price_info['price']:.2f}",
+                    "checked_at": checked_at,
                 }
                 if not dry_run:
                     buy_links.append(new_link)
+                by_store[store_key] = new_link
                 changes.append(f"Added {store} at ${price_info['price']:.2f}")
 
         if not dry_run:
@@ -191,6 +406,17 @@ def main():
     )
     parser.add_argument("--output", help="Write to a different file")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Parallel enrichment workers (default: 8, 1 = serial)",
+    )
+    parser.add_argument(
+        "--max-age-days",
+        type=float,
+        help="Re-check complete products only after their prices are this stale",
+    )
 
     args = parser.parse_args()
 
@@ -198,8 +424,8 @@ def main():
         print(f"Error: {args.data_file} not found", file=sys.stderr)
         sys.exit(1)
 
-    with open(args.data_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(args.data_file, "rb") as f:
+        data = _load_json_bytes(f.read())
 
     products = data.get("products", [])
     if not products:
@@ -208,26 +434,45 @@ def main():
 
     print(f"Enriching {len(products)} products...", file=sys.stderr)
 
+    # Queue all SerpAPI searches server-side up front; workers then pick
+    # up the batch results instead of making one round-trip each.
+    if os.environ.get("SERPAPI_API_KEY"):
+        prefetch_serpapi_batch(
+            [p.get("name", "") for p in products if p.get("name")]
+        )
+
+    # The work is network-bound (one API call per product), so fan out
+    # across a thread pool and report results in input order.
+    workers = max(1, min(args.workers, len(products)))
     total_changes = 0
-    for i, product in enumerate(products):
-        name = product.get("name", f"Product {i + 1}")
-        print(f"  [{i + 1}/{len(products)}] {name}...", file=sys.stderr)
-
-        product, changes = enrich_product(product, dry_run=args.dry_run)
-        if changes:
-            for change in changes:
-                print(f"    {change}", file=sys.stderr)
-            total_changes += len(changes)
-        else:
-            print(f"    No changes", file=sys.stderr)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                enrich_product,
+                product,
+                dry_run=args.dry_run,
+                max_age_days=args.max_age_days,
+            )
+            for product in products
+        ]
+        for i, future in enumerate(futures):
+            name = products[i].get("name", f"Product {i + 1}")
+            print(f"  [{i + 1}/{len(products)}] {name}...", file=sys.stderr)
+
+            product, changes = future.result()
+            if changes:
+                for change in changes:
+                    print(f"    {change}", file=sys.stderr)
+                total_changes += len(changes)
+            else:
+                print(f"    No changes", file=sys.stderr)
 
     if args.dry_run:
         print(f"\nDry run: {total_changes} changes would be made.", file=sys.stderr)
     else:
         output_path = args.output or args.data_file
-        indent = 2 if args.pretty else None
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        with open(output_path, "wb") as f:
+            f.write(_dump_json_bytes(data, pretty=args.pretty))
         print(
             f"\n{total_changes} changes applied. Written to {output_path}",
             file=sys.stderr,
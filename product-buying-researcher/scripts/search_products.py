@@ -31,6 +31,67 @@ import os
 import sys
 import re
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(data, pretty=False):
+    """Encode data to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(
+        data,
+        indent=2 if pretty else None,
+        ensure_ascii=False,
+        separators=(",", ": ") if pretty else (",", ":"),
+    ).encode("utf-8")
+
+
+def _write_json_stream(f, envelope, key, items, pretty=False):
+    """Write output incrementally: envelope fields, then one item at a time.
+
+    Keeps peak memory at one encoded item instead of the whole serialized
+    result. Pretty output keeps the one-shot encoder; it is for human
+    eyes, not large batches.
+    """
+    if pretty:
+        full = dict(envelope)
+        full[key] = items
+        f.write(_dump_json_bytes(full, pretty=True))
+        return
+    f.write(_dump_json_bytes(envelope)[:-1])
+    f.write(b',"' + key.encode("utf-8") + b'":[')
+    for i, item in enumerate(items):
+        if i:
+            f.write(b",")
+        f.write(_dump_json_bytes(item))
+    f.write(b"]}")
+
+
+# Compiled once; runs per result item in both search paths.
+_PRICE_NUM_RE = re.compile(r"[\d,]+\.?\d*")
+
+# Currency symbols and separators dropped before float() parsing.
+_PRICE_STRIP = str.maketrans("", "", "$\u00a3\u20ac, \t\u00a0")
+
+
+def _coerce_price(value):
+    """Coerce a price that may be a number or a string like "$29.99" to float."""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    # Strip currency symbols/separators in one C-level pass and try
+    # float() directly; the regex only runs for oddly formatted strings.
+    stripped = value.translate(_PRICE_STRIP)
+    try:
+        return float(stripped)
+    except ValueError:
+        match = _PRICE_NUM_RE.search(stripped)
+        return float(match.group()) if match else None
+
 
 def search_serpapi(query, max_results=8, min_price=None, max_price=None, country="us"):
     """Search Google Shopping via SerpAPI. Returns structured product data."""
@@ -77,20 +138,15 @@ def search_serpapi(query, max_results=8, min_price=None, max_price=None, country
         return None
 
     shopping_results = results.get("shopping_results", [])
-    products = []
-
-    for item in shopping_results[:max_results]:
-        price_str = item.get("extracted_price") or item.get("price", "")
-        price = None
-        if isinstance(price_str, (int, float)):
-            price = float(price_str)
-        elif isinstance(price_str, str):
-            # Extract numeric price from string like "$29.99"
-            match = re.search(r"[\d,]+\.?\d*", price_str.replace(",", ""))
-            if match:
-                price = float(match.group())
-
-        product = {
+
+    # Extract prices first, then build the output dicts in one
+    # comprehension pass (price filtering happens server-side via params).
+    pairs = [
+        (item, _coerce_price(item.get("extracted_price") or item.get("price", "")))
+        for item in shopping_results[:max_results]
+    ]
+    return [
+        {
             "name": item.get("title", ""),
             "price": price,
             "currency": "USD",
@@ -102,9 +158,8 @@ def search_serpapi(query, max_results=8, min_price=None, max_price=None, country
             "image": item.get("thumbnail", ""),
             "description": item.get("snippet", ""),
         }
-        products.append(product)
-
-    return products
+        for item, price in pairs
+    ]
 
 
 def search_amazon(query, max_results=8, min_price=None, max_price=None, country="us"):
@@ -144,35 +199,31 @@ def search_amazon(query, max_results=8, min_price=None, max_price=None, country=
     if not results:
         return []
 
-    products = []
-    for item in results[:max_results]:
-        price = item.get("price")
-        if isinstance(price, str):
-            match = re.search(r"[\d,]+\.?\d*", price.replace(",", ""))
-            price = float(match.group()) if match else None
-
-        if price is not None:
-            if min_price is not None and price < min_price:
-                continue
-            if max_price is not None and price > max_price:
-                continue
-
-        currency = item.get("currency", "USD")
-        product = {
+    # Three phases: extract prices, apply the price filter, then build
+    # the output dicts — so filtered items never pay dict construction.
+    pairs = [(item, _coerce_price(item.get("price"))) for item in results[:max_results]]
+    lo, hi = min_price, max_price
+    pairs = [
+        (item, price)
+        for item, price in pairs
+        if price is None or ((lo is None or price >= lo) and (hi is None or price <= hi))
+    ]
+    store = f"Amazon ({domain})"
+    return [
+        {
             "name": item.get("title", ""),
             "price": price,
-            "currency": currency,
+            "currency": item.get("currency", "USD"),
             "rating": item.get("rating"),
             "reviews_count": item.get("reviews_count"),
             "source": "amazon",
-            "store": f"Amazon ({domain})",
+            "store": store,
             "url": item.get("url", ""),
             "image": item.get("image", ""),
             "description": "",
         }
-        products.append(product)
-
-    return products
+        for item, price in pairs
+    ]
 
 
 def main():
@@ -236,22 +287,22 @@ def main():
         )
         sys.exit(1)
 
-    output = {
+    envelope = {
         "query": args.query,
         "source": source_used,
         "count": len(products),
-        "products": products,
     }
 
-    indent = 2 if args.pretty else None
-    json_str = json.dumps(output, indent=indent, ensure_ascii=False)
-
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(json_str)
+        with open(args.output, "wb") as f:
+            _write_json_stream(f, envelope, "products", products, pretty=args.pretty)
         print(f"Results written to {args.output}", file=sys.stderr)
     else:
-        print(json_str)
+        _write_json_stream(
+            sys.stdout.buffer, envelope, "products", products, pretty=args.pretty
+        )
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
 
 
 if __name__ == "__main__":
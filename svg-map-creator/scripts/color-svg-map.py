@@ -23,13 +23,45 @@ Data Format (CSV):
     US,#3b82f6,United States
 """
 
-import xml.etree.ElementTree as ET
+try:
+    # lxml parses and serializes in C (libxml2) — roughly an order of
+    # magnitude faster on world maps with tens of thousands of paths.
+    from lxml import etree as ET
+
+    _USING_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+    _USING_LXML = False
+
 import json
 import csv
 import argparse
+import io
+import mmap
 import sys
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    # C-level JSON decode for large choropleth datasets
+    import orjson
+except ImportError:
+    orjson = None
+
+# Extracts (property, value) pairs from a CSS style string in one
+# C-level scan, replacing per-declaration split/strip churn
+_STYLE_RE = re.compile(r"\s*([^:;\s]+)\s*:\s*([^;]+?)\s*(?:;|$)")
+
+# Matches an existing fill declaration for in-place substitution
+_FILL_RE = re.compile(r"fill:[^;]*")
+
+# Matches a style attribute whose only declaration is fill
+_FILL_ONLY_RE = re.compile(r"\s*fill:[^;]*;?\s*")
+
+# Leading numeric part of a width/height attribute ("800px" -> "800")
+_DIM_RE = re.compile(r"[\d.]+")
 
 # Multi-path countries that use class attribute instead of id
 MULTI_PATH_CLASSES = {
@@ -44,6 +76,10 @@ MULTI_PATH_CLASSES = {
     "GB": "United Kingdom",
 }
 
+# Reverse lookup (class name -> code), inverted once at import instead
+# of on every color_map call
+_CLASS_TO_CODE = {v: k for k, v in MULTI_PATH_CLASSES.items()}
+
 
 def parse_data(data_path):
     """
@@ -56,18 +92,19 @@ def parse_data(data_path):
     result = {}
 
     if ext == ".json":
-        with open(data_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            for code, value in data.items():
-                if isinstance(value, str):
-                    # Simple format: {"US": "#3b82f6"}
-                    result[code] = {"color": value, "label": code}
-                elif isinstance(value, dict):
-                    # Extended format: {"US": {"color": "#3b82f6", "label": "..."}}
-                    result[code] = {
-                        "color": value.get("color", "#ececec"),
-                        "label": value.get("label", code),
-                    }
+        with open(data_path, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+        for code, value in data.items():
+            if isinstance(value, str):
+                # Simple format: {"US": "#3b82f6"}
+                result[code] = {"color": value, "label": code}
+            elif isinstance(value, dict):
+                # Extended format: {"US": {"color": "#3b82f6", "label": "..."}}
+                result[code] = {
+                    "color": value.get("color", "#ececec"),
+                    "label": value.get("label", code),
+                }
 
     elif ext == ".csv":
         with open(data_path, "r", encoding="utf-8") as f:
@@ -95,17 +132,9 @@ def parse_style(style_str):
     Returns:
         dict: {property: value}
     """
-    styles = {}
     if not style_str:
-        return styles
-
-    for declaration in style_str.split(";"):
-        declaration = declaration.strip()
-        if ":" in declaration:
-            prop, value = declaration.split(":", 1)
-            styles[prop.strip()] = value.strip()
-
-    return styles
+        return {}
+    return dict(_STYLE_RE.findall(style_str))
 
 
 def style_to_string(styles):
@@ -124,14 +153,33 @@ def set_fill_color(element, color):
     """
     style_attr = element.get("style")
 
-    if style_attr:
-        # Parse existing style and update fill
-        styles = parse_style(style_attr)
-        styles["fill"] = color
-        element.set("style", style_to_string(styles))
-    else:
+    if not style_attr:
         # Set fill attribute directly
         element.set("fill", color)
+    elif "fill:" in style_attr:
+        if _FILL_ONLY_RE.fullmatch(style_attr):
+            # Style carries nothing but a fill declaration: promote it to
+            # the fill presentation attribute — ~15 bytes less per path
+            # in the output and cheaper for downstream renderers
+            element.attrib.pop("style", None)
+            element.set("fill", color)
+        else:
+            # Substitute the existing declaration in place — no dict
+            # round-trip through parse_style/style_to_string
+            element.set("style", _FILL_RE.sub(f"fill:{color}", style_attr, count=1))
+    else:
+        # Prepend a fill declaration to the untouched style
+        element.set("style", f"fill:{color};{style_attr}")
+
+
+def _fmt(value):
+    """Format a coordinate with at most two decimals and no trailing zeros.
+
+    Auto-computed positions (e.g. legend Y derived from a fractional
+    viewBox) would otherwise serialize at full float precision —
+    "523.48291015625" instead of "523.48".
+    """
+    return f"{value:.2f}".rstrip("0").rstrip(".")
 
 
 def add_legend(root, data, legend_x, legend_y, viewbox):
@@ -158,30 +206,53 @@ def add_legend(root, data, legend_x, legend_y, viewbox):
         _, _, _, vb_height = viewbox
         legend_y = vb_height - (len(color_labels) * 20 + 30)
 
-    # Create legend group
-    legend_group = ET.SubElement(root, "g")
-    legend_group.set("id", "legend")
+    # Create legend group. Shared styling lives here once and is
+    # inherited by every item — smaller output and fewer attribute
+    # writes than repeating it on each rect/text.
+    legend_group = ET.SubElement(
+        root,
+        "g",
+        attrib={
+            "id": "legend",
+            "font-family": "sans-serif",
+            "font-size": "12",
+            "fill": "#333",
+            "stroke": "#333",
+            "stroke-width": "0.5",
+        },
+    )
 
-    # Add legend items
+    # Add legend items — attributes go in as one dict per element, so
+    # each node costs a single SubElement call (a C-level attrib
+    # initializer under lxml) instead of six or seven .set() calls
     y_offset = legend_y
+    rect_x = _fmt(legend_x)
+    label_x = _fmt(legend_x + 25)
     for color, label in sorted(color_labels.items(), key=lambda x: x[1]):
-        # Color rectangle
-        rect = ET.SubElement(legend_group, "rect")
-        rect.set("x", str(legend_x))
-        rect.set("y", str(y_offset))
-        rect.set("width", "20")
-        rect.set("height", "14")
-        rect.set("fill", color)
-        rect.set("stroke", "#333")
-        rect.set("stroke-width", "0.5")
-
-        # Label text
-        text = ET.SubElement(legend_group, "text")
-        text.set("x", str(legend_x + 25))
-        text.set("y", str(y_offset + 11))
-        text.set("font-family", "sans-serif")
-        text.set("font-size", "12")
-        text.set("fill", "#333")
+        # Color rectangle (fill overrides the group default)
+        ET.SubElement(
+            legend_group,
+            "rect",
+            attrib={
+                "x": rect_x,
+                "y": _fmt(y_offset),
+                "width": "20",
+                "height": "14",
+                "fill": color,
+            },
+        )
+
+        # Label text (stroke off so glyphs aren't outlined by the
+        # group's rect stroke)
+        text = ET.SubElement(
+            legend_group,
+            "text",
+            attrib={
+                "x": label_x,
+                "y": _fmt(y_offset + 11),
+                "stroke": "none",
+            },
+        )
         text.text = label
 
         y_offset += 20
@@ -198,14 +269,19 @@ def add_title(root, title_text, viewbox):
     """
     _, _, vb_width, _ = viewbox
 
-    title = ET.SubElement(root, "text")
-    title.set("x", str(vb_width / 2))
-    title.set("y", "30")
-    title.set("font-family", "sans-serif")
-    title.set("font-size", "24")
-    title.set("font-weight", "bold")
-    title.set("fill", "#333")
-    title.set("text-anchor", "middle")
+    title = ET.SubElement(
+        root,
+        "text",
+        attrib={
+            "x": _fmt(vb_width / 2),
+            "y": "30",
+            "font-family": "sans-serif",
+            "font-size": "24",
+            "font-weight": "bold",
+            "fill": "#333",
+            "text-anchor": "middle",
+        },
+    )
     title.text = title_text
 
 
@@ -220,12 +296,192 @@ def get_viewbox(root):
     if viewbox_str:
         parts = viewbox_str.split()
         if len(parts) == 4:
-            return tuple(float(p) for p in parts)
+            # Direct unpack builds the tuple without a generator frame
+            x, y, w, h = parts
+            return (float(x), float(y), float(w), float(h))
+
+    # Fallback to width/height attributes; the regex grabs the leading
+    # number so a unit suffix never forces a replace() scan
+    width = _DIM_RE.match(root.get("width", "800"))
+    height = _DIM_RE.match(root.get("height", "600"))
+    return (
+        0,
+        0,
+        float(width.group()) if width else 800.0,
+        float(height.group()) if height else 600.0,
+    )
+
 
-    # Fallback to width/height attributes
-    width = float(root.get("width", "800").replace("px", ""))
-    height = float(root.get("height", "600").replace("px", ""))
-    return (0, 0, width, height)
+def _build_lookup(data):
+    """Build the unified id/class -> (color, code, is_multi_path) table.
+
+    Keys are interned: the hot loop interns the id/class strings it
+    reads off each path, so a table hit compares pointers instead of
+    characters.
+    """
+    lookup = {}
+    for code, info in data.items():
+        lookup[sys.intern(code)] = (info["color"], code, False)
+    for class_name, code in _CLASS_TO_CODE.items():
+        if code in data:
+            lookup[sys.intern(class_name)] = (data[code]["color"], code, True)
+    return lookup
+
+
+def _apply_colors(root, path_tag, lookup, default_color, css_default):
+    """Color every path under root from the lookup table.
+
+    Returns:
+        tuple: (colored_count, multi_path_count, matched_codes)
+    """
+    colored_count = 0
+    multi_path_count = 0
+    matched_codes = set()
+
+    # Bind method and global lookups to locals once; inside the loop
+    # each use is then a single LOAD_FAST instead of an attribute or
+    # module-dict lookup per path
+    lookup_get = lookup.get
+    matched_add = matched_codes.add
+    fill_only_match = _FILL_ONLY_RE.fullmatch
+    fill_sub = _FILL_RE.sub
+    intern = sys.intern
+
+    for path in root.iter(path_tag):
+        # id match first (single-territory), then class (multi-path).
+        # Attribute values come back as fresh strings each time;
+        # interning them makes the dict probe a pointer compare against
+        # the interned table keys.
+        pid = path.get("id")
+        hit = lookup_get(intern(pid)) if pid is not None else None
+        if hit is None:
+            pclass = path.get("class")
+            if pclass is not None:
+                hit = lookup_get(intern(pclass))
+
+        # Apply color (set_fill_color inlined: the call would cost a
+        # frame per matched path in the hottest loop in the script)
+        if hit is not None:
+            color, matched_code, is_multi_path = hit
+            style_attr = path.get("style")
+            if not style_attr:
+                path.set("fill", color)
+            elif "fill:" in style_attr:
+                if fill_only_match(style_attr):
+                    path.attrib.pop("style", None)
+                    path.set("fill", color)
+                else:
+                    path.set("style", fill_sub(f"fill:{color}", style_attr, count=1))
+            else:
+                path.set("style", f"fill:{color};{style_attr}")
+            colored_count += 1
+            matched_add(matched_code)
+            if is_multi_path:
+                multi_path_count += 1
+        elif not css_default:
+            # Apply default color only if no fill is set — a C-level
+            # attrib membership test plus one substring scan, on what is
+            # the dominant branch for sparse datasets. The style (if
+            # any) has no fill declaration here, so the presentation
+            # attribute is both sufficient and the smaller output form
+            attrib = path.attrib
+            if "fill" not in attrib and "fill:" not in attrib.get("style", ""):
+                path.set("fill", default_color)
+
+    return colored_count, multi_path_count, matched_codes
+
+
+# huge_tree lifts libxml2's node/depth limits, which detailed world
+# maps can exceed
+_SVG_PARSER = ET.XMLParser(huge_tree=True) if _USING_LXML else None
+
+# Minify parser: drop comments, processing instructions, and
+# whitespace-only text nodes at parse time so they never reach the
+# serializer (stdlib ET already drops comments/PIs; blank text stays)
+_MINIFY_PARSER = (
+    ET.XMLParser(
+        huge_tree=True,
+        remove_blank_text=True,
+        remove_comments=True,
+        remove_pis=True,
+    )
+    if _USING_LXML
+    else None
+)
+
+# Editor-private namespaces whose elements carry no rendering
+# information (Inkscape session state, Sodipodi grid settings)
+_STRIP_NS = (
+    "{http://www.inkscape.org/namespaces/inkscape}",
+    "{http://sodipodi.sourceforge.net/DTD/sodipodi-0.0.dtd}",
+)
+
+
+def _strip_editor_cruft(root):
+    """Remove metadata and editor-private elements from the tree.
+
+    Files from Natural Earth or Wikipedia often ship large <metadata>
+    blocks and Inkscape/Sodipodi state that bloat the output without
+    affecting rendering.
+    """
+    doomed = [
+        elem
+        for elem in root.iter()
+        if isinstance(elem.tag, str)
+        and (elem.tag.rsplit("}", 1)[-1] == "metadata" or elem.tag.startswith(_STRIP_NS))
+    ]
+    if not doomed:
+        return
+    if _USING_LXML:
+        for elem in doomed:
+            parent = elem.getparent()
+            if parent is not None:
+                parent.remove(elem)
+    else:
+        # stdlib elements don't know their parent — map children once
+        parent_map = {child: parent for parent in root.iter() for child in parent}
+        for elem in doomed:
+            parent = parent_map.get(elem)
+            if parent is not None:
+                parent.remove(elem)
+
+
+def _parse_svg(input_path, parser=None):
+    """Parse an SVG file into (tree, root), reading it through mmap.
+
+    Memory-mapping hands the parser one contiguous buffer straight from
+    the kernel page cache instead of looping through Python-level I/O
+    buffers — noticeable on multi-megabyte world maps.
+    """
+    try:
+        with open(input_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    raw = mm.read()
+            except ValueError:
+                # Empty or unmappable file: let the parser report it
+                raw = f.read()
+    except OSError as e:
+        raise FileNotFoundError(f"Input SVG file not found: {input_path}") from e
+
+    if _USING_LXML:
+        root = ET.fromstring(raw, parser or _SVG_PARSER)
+        return root.getroottree(), root
+    root = ET.fromstring(raw)
+    return ET.ElementTree(root), root
+
+
+def _write_tree(tree, output_path):
+    """Serialize the tree through a large buffered binary handle.
+
+    The serializer (libxml2's C writer under lxml) streams into one
+    buffer instead of many small file writes.
+    """
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        if _USING_LXML:
+            tree.write(f, encoding="utf-8", xml_declaration=True, pretty_print=False)
+        else:
+            tree.write(f, encoding="utf-8", xml_declaration=True)
 
 
 def color_map(
@@ -237,6 +493,8 @@ def color_map(
     title_text=None,
     legend_x=50,
     legend_y=None,
+    css_default=False,
+    minify=False,
 ):
     """
     Apply colors to SVG map regions based on data file.
@@ -250,77 +508,57 @@ def color_map(
         title_text: Optional title text
         legend_x: X position for legend
         legend_y: Y position for legend (None for auto)
+        css_default: Emit one CSS default rule instead of writing a
+            fill on every unmatched path (smaller output)
+        minify: Strip metadata, editor-private elements, and (under
+            lxml) comments and blank text from the output
 
     Returns:
         dict: Statistics about the coloring operation
     """
-    # Validate input file
-    if not os.path.exists(input_path):
-        raise FileNotFoundError(f"Input SVG file not found: {input_path}")
-
-    if not os.path.exists(data_path):
-        raise FileNotFoundError(f"Data file not found: {data_path}")
-
-    # Parse data
-    data = parse_data(data_path)
+    # Parse data — open() itself reports a missing file, so no stat
+    # round-trip beforehand
+    try:
+        data = parse_data(data_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Data file not found: {data_path}") from e
 
-    # Register SVG namespace to prevent ns0: prefix
-    ET.register_namespace("", "http://www.w3.org/2000/svg")
+    # Register SVG namespace to prevent ns0: prefix (lxml keeps the
+    # original prefixes on its own)
+    if not _USING_LXML:
+        ET.register_namespace("", "http://www.w3.org/2000/svg")
 
     # Parse SVG
-    tree = ET.parse(input_path)
-    root = tree.getroot()
+    tree, root = _parse_svg(input_path, parser=_MINIFY_PARSER if minify else None)
+    if minify:
+        _strip_editor_cruft(root)
 
     # Get viewbox for legend/title positioning
     viewbox = get_viewbox(root)
 
-    # Track statistics
-    colored_count = 0
-    multi_path_count = 0
-    matched_codes = set()
-
-    # Build reverse lookup for multi-path countries
-    class_to_code = {v: k for k, v in MULTI_PATH_CLASSES.items()}
-
-    # Find all path elements (handle namespaced and non-namespaced)
-    paths = root.findall(".//{http://www.w3.org/2000/svg}path")
-    if not paths:
-        paths = root.findall(".//path")
+    # Unified lookup: id codes and multi-path class names both map to
+    # (color, code, is_multi_path), so each path costs at most two dict
+    # gets and no strip() on attributes that are never padded
+    lookup = _build_lookup(data)
+
+    # Derive the namespace from the root tag once, then walk the tree
+    # with a single iterator instead of materializing a findall list
+    # (twice, when the no-namespace fallback kicked in)
+    namespace = root.tag.split("}")[0][1:] if "}" in root.tag else ""
+    path_tag = f"{{{namespace}}}path" if namespace else "path"
+
+    if css_default:
+        # One stylesheet rule replaces a fill attribute on every
+        # unmatched path. Scoped to paths without a fill attribute so it
+        # never overrides explicit fills (inline styles win regardless).
+        style_el = ET.Element(f"{{{namespace}}}style" if namespace else "style")
+        style_el.text = f"path:not([fill]){{fill:{default_color}}}"
+        root.insert(0, style_el)
 
     # Color paths
-    for path in paths:
-        path_id = path.get("id", "").strip()
-        path_class = path.get("class", "").strip()
-
-        color = None
-        matched_code = None
-
-        # Check id attribute
-        if path_id in data:
-            color = data[path_id]["color"]
-            matched_code = path_id
-
-        # Check class attribute (for multi-path countries)
-        elif path_class in class_to_code:
-            code = class_to_code[path_class]
-            if code in data:
-                color = data[code]["color"]
-                matched_code = code
-                multi_path_count += 1
-
-        # Apply color
-        if color:
-            set_fill_color(path, color)
-            colored_count += 1
-            matched_codes.add(matched_code)
-        else:
-            # Apply default color only if no fill is set
-            current_fill = path.get("fill")
-            current_style = path.get("style", "")
-
-            # Check if path has no explicit fill
-            if not current_fill and "fill:" not in current_style:
-                set_fill_color(path, default_color)
+    colored_count, multi_path_count, matched_codes = _apply_colors(
+        root, path_tag, lookup, default_color, css_default
+    )
 
     # Find unmatched codes
     unmatched_codes = set(data.keys()) - matched_codes
@@ -334,7 +572,7 @@ def color_map(
         add_title(root, title_text, viewbox)
 
     # Write output
-    tree.write(output_path, encoding="utf-8", xml_declaration=True)
+    _write_tree(tree, output_path)
 
     # Return statistics
     return {
@@ -345,6 +583,152 @@ def color_map(
     }
 
 
+def _render_frame(svg_bytes, data_path, output_path, default_color, css_default):
+    """Render one batch frame in a worker process.
+
+    lxml trees don't pickle, so parallel batches ship the serialized
+    tree as bytes and each worker re-parses from memory — still far
+    cheaper than re-reading and re-parsing from disk per frame.
+    """
+    if not _USING_LXML:
+        ET.register_namespace("", "http://www.w3.org/2000/svg")
+
+    tree = ET.parse(io.BytesIO(svg_bytes))
+    root = tree.getroot()
+
+    namespace = root.tag.split("}")[0][1:] if "}" in root.tag else ""
+    path_tag = f"{{{namespace}}}path" if namespace else "path"
+
+    if css_default:
+        style_el = ET.Element(f"{{{namespace}}}style" if namespace else "style")
+        style_el.text = f"path:not([fill]){{fill:{default_color}}}"
+        root.insert(0, style_el)
+
+    try:
+        data = parse_data(data_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Data file not found: {data_path}") from e
+
+    lookup = _build_lookup(data)
+    colored_count, multi_path_count, matched_codes = _apply_colors(
+        root, path_tag, lookup, default_color, css_default
+    )
+    _write_tree(tree, output_path)
+
+    unmatched_codes = set(data.keys()) - matched_codes
+    return {
+        "colored": colored_count,
+        "multi_path": multi_path_count,
+        "unmatched": len(unmatched_codes),
+        "unmatched_codes": sorted(unmatched_codes),
+    }
+
+
+def color_map_batch(
+    input_path,
+    data_output_pairs,
+    default_color="#ececec",
+    css_default=False,
+    workers=None,
+):
+    """
+    Color one input SVG against many data files, parsing it only once.
+
+    Rendering N variants of the same map (dashboard panels, animation
+    frames) through color_map re-parses the input N times, and parsing
+    dominates on large maps. This parses once, snapshots the original
+    fill/style of every path, then for each (data_path, output_path)
+    pair applies the colors, serializes, and restores the snapshot.
+
+    Args:
+        input_path: Path to input SVG file
+        data_output_pairs: Iterable of (data_path, output_path) tuples
+        default_color: Default fill color for unmatched regions
+        css_default: Emit one CSS default rule instead of writing a
+            fill on every unmatched path (smaller output)
+        workers: Render frames in this many processes (None or 1 for
+            sequential in-process rendering)
+
+    Returns:
+        list: One statistics dict per pair (same shape as color_map)
+    """
+    if not _USING_LXML:
+        ET.register_namespace("", "http://www.w3.org/2000/svg")
+
+    tree, root = _parse_svg(input_path)
+
+    if workers and workers > 1:
+        # Serialize once and fan the bytes out; per-frame serialization
+        # (the bottleneck once parsing is amortized) runs on all cores
+        buf = io.BytesIO()
+        if _USING_LXML:
+            tree.write(buf, encoding="utf-8", xml_declaration=True, pretty_print=False)
+        else:
+            tree.write(buf, encoding="utf-8", xml_declaration=True)
+        svg_bytes = buf.getvalue()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    _render_frame,
+                    svg_bytes,
+                    data_path,
+                    output_path,
+                    default_color,
+                    css_default,
+                )
+                for data_path, output_path in data_output_pairs
+            ]
+            return [f.result() for f in futures]
+
+    namespace = root.tag.split("}")[0][1:] if "}" in root.tag else ""
+    path_tag = f"{{{namespace}}}path" if namespace else "path"
+
+    # Snapshot original fill/style so every frame starts from the
+    # untouched tree without re-parsing
+    snapshot = [(p, p.get("fill"), p.get("style")) for p in root.iter(path_tag)]
+
+    if css_default:
+        style_el = ET.Element(f"{{{namespace}}}style" if namespace else "style")
+        style_el.text = f"path:not([fill]){{fill:{default_color}}}"
+        root.insert(0, style_el)
+
+    results = []
+    for data_path, output_path in data_output_pairs:
+        try:
+            data = parse_data(data_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Data file not found: {data_path}") from e
+
+        lookup = _build_lookup(data)
+        colored_count, multi_path_count, matched_codes = _apply_colors(
+            root, path_tag, lookup, default_color, css_default
+        )
+        _write_tree(tree, output_path)
+
+        unmatched_codes = set(data.keys()) - matched_codes
+        results.append(
+            {
+                "colored": colored_count,
+                "multi_path": multi_path_count,
+                "unmatched": len(unmatched_codes),
+                "unmatched_codes": sorted(unmatched_codes),
+            }
+        )
+
+        # Restore originals before the next frame
+        for path, fill, style in snapshot:
+            if fill is None:
+                path.attrib.pop("fill", None)
+            else:
+                path.set("fill", fill)
+            if style is None:
+                path.attrib.pop("style", None)
+            else:
+                path.set("style", style)
+
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Apply colors to SVG map regions from JSON/CSV data",
@@ -374,6 +758,18 @@ def main():
         type=float,
         help="Y position for legend (default: auto-calculated)",
     )
+    parser.add_argument(
+        "--css-default",
+        action="store_true",
+        help="Use one CSS rule for the default color instead of a fill "
+        "attribute on every unmatched path (smaller output)",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Strip metadata, editor-private elements, and (with lxml) "
+        "comments and blank text from the output",
+    )
 
     args = parser.parse_args()
 
@@ -387,6 +783,8 @@ def main():
             title_text=args.title,
             legend_x=args.legend_x,
             legend_y=args.legend_y,
+            css_default=args.css_default,
+            minify=args.minify,
         )
 
         print(f"Success! Colored {stats['colored']} regions")